@@ -8,101 +8,226 @@ import json
 import re
 import sys
 import argparse
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit, parse_qs
 from pathlib import Path
+from functools import lru_cache
+from collections import Counter, namedtuple
+from itertools import islice
 import base64
 import random
 
-class CharlesToCSConverter:
-    def __init__(self):
-        self.common_params = [
-            'q', 'search', 'query', 'id', 'sid', 'sessionid', 'token', 'auth',
-            'key', 'api_key', 'callback', 'format', 'type', 'action', 'cmd',
-            'data', 'payload', 'content', 'message', 'response', 'result'
-        ]
+# Prefer a C-accelerated JSON parser for large HAR captures
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+    except ImportError:
+        _json_loads = json.loads
+
+# Stream HAR entries instead of loading the whole capture when ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Data shared by the block generators, collected in one pass over the requests
+# (metadata_param is None when no query parameter qualifies, first_values is keyed
+# by exact header name and first_values_lc by lowercased name). post is the same
+# summary for the POST requests alone, or None when there are none; its
+# metadata_param, first_values_lc and post fields are unused and left as None.
+_RequestSummary = namedtuple(
+    '_RequestSummary',
+    ['uri_patterns', 'common_headers', 'metadata_param', 'first_values', 'first_values_lc', 'post']
+)
+
+# Headers left out of the common header counts
+_SKIPPED_HEADERS = frozenset({'content-length', 'content-encoding'})
+
+# Captured headers copied into each client block (lowercased)
+_GET_CLIENT_HEADERS = frozenset({
+    'host', 'user-agent', 'accept', 'accept-language',
+    'accept-encoding', 'connection', 'referer'
+})
+_POST_CLIENT_HEADERS = frozenset({'host', 'user-agent', 'accept', 'content-type', 'referer'})
+_STAGER_CLIENT_HEADERS = ('host', 'user-agent', 'accept', 'accept-encoding')
+
+_NL = '\n'
+
+# Static parts of the generated blocks
+_GET_SERVER_BLOCK = '''    server {{
+        header "Server" "nginx/1.18.0";
+        header "Content-Type" "text/html; charset=UTF-8";
+        header "Connection" "keep-alive";
+        header "Cache-Control" "no-cache, no-store, must-revalidate";
         
-        self.cs_encodings = [
-            'base64', 'base64url', 'netbios', 'netbiosu', 'mask'
-        ]
+        output {{
+            netbios;
+            prepend "<!DOCTYPE html><html><head><title>Search Results</title></head><body>";
+            append "</body></html>";
+        }}
+    }}
+}}'''
+
+_POST_SERVER_BLOCK = '''    server {{
+        header "Server" "nginx/1.18.0";
+        header "Content-Type" "application/json";
+        header "Connection" "keep-alive";
+        
+        output {{
+            netbios;
+            prepend "{\\"status\\":\\"success\\",\\"data\\":\\"";
+            append "\\"}}";
+        }}
+    }}
+}}'''
+
+_STAGER_SERVER_BLOCK = '''    server {{
+        header "Server" "nginx/1.18.0";
+        header "Content-Type" "application/octet-stream";
+        header "Connection" "keep-alive";
+        
+        output {{
+            prepend "<!DOCTYPE html><html><body>";
+            append "</body></html>";
+        }}
+    }}
+}}'''
+
+_HTTP_CONFIG_BLOCK = '''http-config {{
+    set headers "Date, Server, Content-Length, Keep-Alive, Connection, Content-Type";
+    set headers_remove "Server, X-Powered-By, X-AspNet-Version";
+    
+    set trust_x_forwarded_for "false";
+    set block_useragents "curl*, HTTPie*, wget*, python-requests*";
+}}'''
+
+# Parameter names for http-post id and output placement
+_POST_ID_PARAMS = ('id', 'sessionid', 'token', 'key')
+_POST_OUTPUT_PARAMS = ('data', 'content', 'response', 'result')
+
+
+@lru_cache(maxsize=4096)
+def _split_url(url):
+    """Split a URL into its path and raw query string"""
+    parsed_url = urlsplit(url)
+    return parsed_url.path, parsed_url.query
+
+
+def _query_params(req):
+    """Return a request's query parameters, parsing the raw query on demand"""
+    if 'query_params' in req:
+        return req['query_params']
+    return parse_qs(req.get('query', ''))
+
+
+def _index_headers(headers):
+    """Map lowercased header names to their (name, value) pair"""
+    return {k.lower(): (k, v) for k, v in headers.items()}
+
+
+def _lowercase_headers(req):
+    """Return a request's lowercased header index, building it if missing"""
+    headers_lc = req.get('_headers_lc')
+    if headers_lc is None:
+        headers_lc = _index_headers(req.get('headers', {}))
+    return headers_lc
+
+
+def _parse_har_entry(entry):
+    """Parse a single HAR entry into the request fields used for generation"""
+    request = entry['request']
+    
+    parsed_request = {
+        'method': request['method'],
+        'url': request['url'],
+        'headers': {h['name']: h['value'] for h in request['headers']},
+        'post_data': None
+    }
+    
+    parsed_request['_headers_lc'] = _index_headers(parsed_request['headers'])
+    
+    # Split URL (cached, captures repeat URLs a lot), query parameters are parsed on demand
+    parsed_request['path'], parsed_request['query'] = _split_url(request['url'])
+    
+    # Parse POST data
+    if 'postData' in request and request['postData']:
+        parsed_request['post_data'] = request['postData']
+    
+    return parsed_request
+
+class CharlesToCSConverter:
+    # No per-instance state, everything below is shared by all converters
+    __slots__ = ()
+    
+    common_params = (
+        'q', 'search', 'query', 'id', 'sid', 'sessionid', 'token', 'auth',
+        'key', 'api_key', 'callback', 'format', 'type', 'action', 'cmd',
+        'data', 'payload', 'content', 'message', 'response', 'result'
+    )
+    
+    cs_encodings = ('base64', 'base64url', 'netbios', 'netbiosu', 'mask')
+    
+    # Header lines of a raw HTTP message ("Name: value")
+    _HEADER_RE = re.compile(r'(?m)^[ \t]*([^:\r\n]+?)[ \t]*:[ \t]*([^\r\n]*?)[ \t]*\r?$')
+    # Blank line separating headers from body
+    _BODY_SEPARATOR_RE = re.compile(r'\r?\n[ \t]*\r?\n')
     
     def parse_har_file(self, har_path):
         """Parse HAR file exported from Charles Proxy"""
         try:
-            with open(har_path, 'r', encoding='utf-8') as f:
-                har_data = json.load(f)
-            
-            entries = har_data['log']['entries']
-            requests = []
-            
-            for entry in entries:
-                request = entry['request']
-                response = entry['response']
-                
-                parsed_request = {
-                    'method': request['method'],
-                    'url': request['url'],
-                    'headers': {h['name']: h['value'] for h in request['headers']},
-                    'query_params': {},
-                    'post_data': None,
-                    'response_headers': {h['name']: h['value'] for h in response['headers']},
-                    'response_body': None
-                }
-                
-                # Parse URL parameters
-                parsed_url = urlparse(request['url'])
-                parsed_request['path'] = parsed_url.path
-                parsed_request['query_params'] = parse_qs(parsed_url.query)
-                
-                # Parse POST data
-                if 'postData' in request and request['postData']:
-                    parsed_request['post_data'] = request['postData']
-                
-                # Get response body
-                if 'text' in response['content']:
-                    parsed_request['response_body'] = response['content']['text']
-                
-                requests.append(parsed_request)
-            
-            return requests
+            return list(self.iter_har_requests(har_path))
             
         except Exception as e:
             print(f"Error parsing HAR file: {e}")
             return []
     
+    def iter_har_requests(self, har_path):
+        """Yield parsed requests from a HAR file, streaming entries with ijson if available"""
+        try:
+            with open(har_path, 'rb') as f:
+                if ijson is not None:
+                    for entry in ijson.items(f, 'log.entries.item'):
+                        yield _parse_har_entry(entry)
+                    return
+                
+                entries = _json_loads(f.read())['log']['entries']
+            
+            for entry in entries:
+                yield _parse_har_entry(entry)
+        finally:
+            _split_url.cache_clear()
+    
     def parse_raw_http(self, raw_http):
         """Parse raw HTTP request/response text"""
         try:
-            lines = raw_http.strip().split('\n')
-            if not lines:
+            # Split headers from body at the first blank line
+            head, *rest = self._BODY_SEPARATOR_RE.split(raw_http.lstrip(), 1)
+            head = head.rstrip()
+            if not head:
                 return None
             
             # Parse request line
-            request_line = lines[0].strip()
-            method, path, version = request_line.split(' ', 2)
+            request_line, _, header_block = head.partition('\n')
+            method, path, version = request_line.strip().split(' ', 2)
             
             # Parse headers
-            headers = {}
-            body_start = len(lines)
-            
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '':
-                    body_start = i + 1
-                    break
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    headers[key.strip()] = value.strip()
+            headers = dict(self._HEADER_RE.findall(header_block))
             
             # Parse body
-            body = '\n'.join(lines[body_start:]) if body_start < len(lines) else None
+            body = (rest[0].rstrip() or None) if rest else None
             
             # Extract URL components
-            parsed_url = urlparse(path)
+            parsed_url = urlsplit(path)
             
             return {
                 'method': method,
                 'path': parsed_url.path,
                 'query_params': parse_qs(parsed_url.query),
                 'headers': headers,
+                '_headers_lc': _index_headers(headers),
                 'body': body
             }
             
@@ -113,13 +238,17 @@ class CharlesToCSConverter:
     def generate_uri_patterns(self, requests):
         """Generate URI patterns from captured requests"""
         paths = [req['path'] for req in requests if req.get('path')]
-        
-        # Extract common patterns
-        unique_paths = list(set(paths))
+        return self._uri_patterns_from_paths(paths)
+    
+    def _uri_patterns_from_paths(self, paths):
+        """Build URI patterns from a list of request paths"""
+        # Extract common patterns, in capture order
+        seen = set()
+        unique_paths = (path for path in paths if not (path in seen or seen.add(path)))
         
         # Generate variations
         uri_patterns = []
-        for path in unique_paths[:5]:  # Limit to 5 patterns
+        for path in islice(unique_paths, 5):  # Limit to 5 patterns
             # Add original path
             uri_patterns.append(path)
             
@@ -142,63 +271,134 @@ class CharlesToCSConverter:
     
     def extract_common_headers(self, requests):
         """Extract common headers from requests"""
-        header_counts = {}
+        header_counts = Counter()
         
         for req in requests:
-            for header, value in req.get('headers', {}).items():
-                if header.lower() not in ['content-length', 'content-encoding']:
-                    header_counts[header] = header_counts.get(header, 0) + 1
+            header_counts.update(h for h in req.get('headers', {}) if h.lower() not in _SKIPPED_HEADERS)
         
-        # Sort by frequency and return most common
-        common_headers = sorted(header_counts.items(), key=lambda x: x[1], reverse=True)
-        return [header for header, count in common_headers[:10]]
+        return self._most_common_headers(header_counts)
+    
+    def _most_common_headers(self, header_counts):
+        """Return the most frequent header names"""
+        return [header for header, count in header_counts.most_common(10)]
     
     def select_parameter_for_metadata(self, requests):
         """Select best parameter for metadata placement"""
-        param_counts = {}
+        param_counts = Counter()
         
         for req in requests:
-            for param_list in req.get('query_params', {}).values():
-                for param in param_list:
-                    if len(param) > 4:  # Prefer longer parameters
-                        param_counts[param] = param_counts.get(param, 0) + 1
-        
+            for param_list in _query_params(req).values():
+                param_counts.update(p for p in param_list if len(p) > 4)  # Prefer longer parameters
+        
+        metadata_param = self._best_metadata_parameter(param_counts)
+        if metadata_param is None:
+            # Return a suitable parameter from common list
+            metadata_param = random.choice(self.common_params)
+        return metadata_param
+    
+    def _best_metadata_parameter(self, param_counts):
+        """Return the most common parameter, or None if there are none"""
         if param_counts:
-            # Return most common parameter
-            return max(param_counts.items(), key=lambda x: x[1])[0]
+            return param_counts.most_common(1)[0][0]
+        return None
+    
+    def _summarize_requests(self, requests, count_params=True):
+        """Collect URI patterns, common headers, metadata parameter and header values in one pass"""
+        paths = []
+        header_counts = Counter()
+        param_counts = Counter()
+        first_values = {}  # header name -> first captured value
+        first_values_lc = {}  # lowercased header name -> first captured value
+        
+        # The same, restricted to POST requests (for http-post)
+        has_post = False
+        post_paths = []
+        post_header_counts = Counter()
+        post_first_values = {}
         
-        # Return a suitable parameter from common list
-        return random.choice(self.common_params)
+        for req in requests:
+            is_post = req.get('method') == 'POST'
+            has_post = has_post or is_post
+            
+            if req.get('path'):
+                paths.append(req['path'])
+                if is_post:
+                    post_paths.append(req['path'])
+            
+            # Count by exact name, so every spelling of a header is kept
+            for name, value in req.get('headers', {}).items():
+                counted = name.lower() not in _SKIPPED_HEADERS
+                first_values.setdefault(name, value)
+                if counted:
+                    header_counts[name] += 1
+                if is_post:
+                    post_first_values.setdefault(name, value)
+                    if counted:
+                        post_header_counts[name] += 1
+            
+            for lc, (name, value) in _lowercase_headers(req).items():
+                first_values_lc.setdefault(lc, value)
+            
+            # Only http-get places metadata, other blocks skip parsing queries
+            if count_params:
+                for param_list in _query_params(req).values():
+                    param_counts.update(p for p in param_list if len(p) > 4)  # Prefer longer parameters
+        
+        post_summary = None
+        if has_post:
+            post_summary = _RequestSummary(
+                uri_patterns=self._uri_patterns_from_paths(post_paths),
+                common_headers=self._most_common_headers(post_header_counts),
+                metadata_param=None,
+                first_values=post_first_values,
+                first_values_lc=None,
+                post=None
+            )
+        
+        return _RequestSummary(
+            uri_patterns=self._uri_patterns_from_paths(paths),
+            common_headers=self._most_common_headers(header_counts),
+            metadata_param=self._best_metadata_parameter(param_counts),
+            first_values=first_values,
+            first_values_lc=first_values_lc,
+            post=post_summary
+        )
     
-    def generate_http_get_block(self, requests):
+    def generate_http_get_block(self, requests, summary=None):
         """Generate http-get block"""
-        uri_patterns = self.generate_uri_patterns(requests)
-        common_headers = self.extract_common_headers(requests)
-        metadata_param = self.select_parameter_for_metadata(requests)
-        
-        # Get a sample request for reference
-        sample_req = requests[0] if requests else {}
+        parts = []
+        self._emit_http_get(parts.append, requests, summary)
+        return ''.join(parts)
+    
+    def _emit_http_get(self, write, requests, summary=None):
+        """Write http-get block"""
+        if summary is None:
+            summary = self._summarize_requests(requests)
+        uri_patterns = summary.uri_patterns
+        common_headers = summary.common_headers
+        first_values = summary.first_values
+        
+        metadata_param = summary.metadata_param
+        if metadata_param is None:
+            # Fall back to a suitable parameter from common list
+            metadata_param = random.choice(self.common_params)
         
         # Generate client block
         client_headers = []
         for header in common_headers[:8]:
-            if header.lower() in ['host', 'user-agent', 'accept', 'accept-language', 
-                                'accept-encoding', 'connection', 'referer']:
+            if header.lower() in _GET_CLIENT_HEADERS and header in first_values:
                 # Use actual values from captured traffic
-                for req in requests:
-                    if header in req.get('headers', {}):
-                        value = req['headers'][header]
-                        client_headers.append(f'        header "{header}" "{value}";')
-                        break
+                client_headers.append(f'        header "{header}" "{first_values[header]}";')
         
         # Generate metadata block
         encoding = random.choice(self.cs_encodings)
         
-        block = f'''http-get {{{{
+        client_block = _NL.join(client_headers)
+        write(f'''http-get {{{{
     set uri "{' '.join(uri_patterns)}";
     
     client {{{{
-{chr(10).join(client_headers)}
+{client_block}
         
         metadata {{{{
             {encoding};
@@ -206,53 +406,47 @@ class CharlesToCSConverter:
         }}}}
     }}}}
     
-    server {{{{
-        header "Server" "nginx/1.18.0";
-        header "Content-Type" "text/html; charset=UTF-8";
-        header "Connection" "keep-alive";
-        header "Cache-Control" "no-cache, no-store, must-revalidate";
-        
-        output {{{{
-            netbios;
-            prepend "<!DOCTYPE html><html><head><title>Search Results</title></head><body>";
-            append "</body></html>";
-        }}}}
-    }}}}
-}}}}'''
-        
-        return block
+''')
+        write(_GET_SERVER_BLOCK)
     
-    def generate_http_post_block(self, requests):
+    def generate_http_post_block(self, requests, summary=None):
         """Generate http-post block"""
-        post_requests = [req for req in requests if req.get('method') == 'POST']
+        parts = []
+        self._emit_http_post(parts.append, requests, summary)
+        return ''.join(parts)
+    
+    def _emit_http_post(self, write, requests, summary=None):
+        """Write http-post block"""
+        if summary is None:
+            summary = self._summarize_requests(requests, count_params=False)
         
-        if not post_requests:
+        if summary.post is None:
             # Generate default POST block
             uri_patterns = ["/submit", "/api/data", "/upload"]
         else:
-            uri_patterns = self.generate_uri_patterns(post_requests)
+            # Use POST traffic only when there is some
+            summary = summary.post
+            uri_patterns = summary.uri_patterns
         
-        common_headers = self.extract_common_headers(post_requests or requests)
+        common_headers = summary.common_headers
+        first_values = summary.first_values
         
         # Generate client headers
         client_headers = []
         for header in common_headers[:8]:
-            if header.lower() in ['host', 'user-agent', 'accept', 'content-type', 'referer']:
-                for req in (post_requests or requests):
-                    if header in req.get('headers', {}):
-                        value = req['headers'][header]
-                        client_headers.append(f'        header "{header}" "{value}";')
-                        break
+            if header.lower() in _POST_CLIENT_HEADERS and header in first_values:
+                client_headers.append(f'        header "{header}" "{first_values[header]}";')
         
         # Select parameters for data placement
-        id_param = random.choice(['id', 'sessionid', 'token', 'key'])
-        output_param = random.choice(['data', 'content', 'response', 'result'])
+        id_param = random.choice(_POST_ID_PARAMS)
+        output_param = random.choice(_POST_OUTPUT_PARAMS)
         
-        block = f'''http-post {{{{
+        client_block = _NL.join(client_headers)
+        write(f'''http-post {{{{
     set uri "{' '.join(uri_patterns)}";
     
     client {{{{
-{chr(10).join(client_headers)}
+{client_block}
         
         id {{{{
             netbios;
@@ -265,93 +459,67 @@ class CharlesToCSConverter:
         }}}}
     }}}}
     
-    server {{{{
-        header "Server" "nginx/1.18.0";
-        header "Content-Type" "application/json";
-        header "Connection" "keep-alive";
-        
-        output {{{{
-            netbios;
-            prepend "{{\\"status\\":\\"success\\",\\"data\\":\\"";
-            append "\\"}}}}";
-        }}}}
-    }}}}
-}}}}'''
-        
-        return block
+''')
+        write(_POST_SERVER_BLOCK)
     
-    def generate_http_stager_block(self, requests):
+    def generate_http_stager_block(self, requests, summary=None):
         """Generate http-stager block"""
-        uri_patterns = self.generate_uri_patterns(requests)
-        common_headers = self.extract_common_headers(requests)
+        parts = []
+        self._emit_http_stager(parts.append, requests, summary)
+        return ''.join(parts)
+    
+    def _emit_http_stager(self, write, requests, summary=None):
+        """Write http-stager block"""
+        if summary is None:
+            summary = self._summarize_requests(requests, count_params=False)
+        uri_patterns = summary.uri_patterns
+        first_values = summary.first_values_lc
         
         # Generate client headers for stager
         client_headers = []
-        essential_headers = ['host', 'user-agent', 'accept', 'accept-encoding']
+        for header in _STAGER_CLIENT_HEADERS:
+            if header in first_values:
+                client_headers.append(f'        header "{header.title()}" "{first_values[header]}";')
         
-        for header in essential_headers:
-            for req in requests:
-                req_headers = {k.lower(): v for k, v in req.get('headers', {}).items()}
-                if header in req_headers:
-                    value = req_headers[header]
-                    client_headers.append(f'        header "{header.title()}" "{value}";')
-                    break
-        
-        block = f'''http-stager {{{{
+        client_block = _NL.join(client_headers)
+        write(f'''http-stager {{{{
     set uri_x86 "{uri_patterns[0] if uri_patterns else '/api/x86'}";
     set uri_x64 "{uri_patterns[1] if len(uri_patterns) > 1 else '/api/x64'}";
     
     client {{{{
-{chr(10).join(client_headers)}
+{client_block}
     }}}}
     
-    server {{{{
-        header "Server" "nginx/1.18.0";
-        header "Content-Type" "application/octet-stream";
-        header "Connection" "keep-alive";
-        
-        output {{{{
-            prepend "<!DOCTYPE html><html><body>";
-            append "</body></html>";
-        }}}}
-    }}}}
-}}}}'''
-        
-        return block
+''')
+        write(_STAGER_SERVER_BLOCK)
     
     def generate_http_config_block(self, requests):
         """Generate http-config block"""
-        # Extract headers for configuration
-        sample_headers = {}
-        if requests:
-            sample_headers = requests[0].get('headers', {})
-        
-        # Common headers to set
-        user_agent = sample_headers.get('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        
-        block = f'''http-config {{{{
-    set headers "Date, Server, Content-Length, Keep-Alive, Connection, Content-Type";
-    set headers_remove "Server, X-Powered-By, X-AspNet-Version";
+        parts = []
+        self._emit_http_config(parts.append, requests)
+        return ''.join(parts)
     
-    set trust_x_forwarded_for "false";
-    set block_useragents "curl*, HTTPie*, wget*, python-requests*";
-}}}}'''
-        
-        return block
+    def _emit_http_config(self, write, requests):
+        """Write http-config block"""
+        write(_HTTP_CONFIG_BLOCK)
     
     def generate_full_profile(self, requests, profile_name="Generated Profile"):
         """Generate complete CS profile"""
-        http_config = self.generate_http_config_block(requests)
-        http_get = self.generate_http_get_block(requests)
-        http_post = self.generate_http_post_block(requests)
-        http_stager = self.generate_http_stager_block(requests)
+        parts = []
+        self.write_full_profile(parts.append, requests, profile_name)
+        return ''.join(parts)
+    
+    def write_full_profile(self, write, requests, profile_name="Generated Profile"):
+        """Write complete CS profile fragment by fragment through write()"""
+        summary = self._summarize_requests(requests)
+        uri_patterns = summary.uri_patterns
         
         # Extract user agent for global setting
         user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         if requests and requests[0].get('headers', {}).get('User-Agent'):
             user_agent = requests[0]['headers']['User-Agent']
         
-        profile = f'''#
+        write(f'''#
 # {profile_name}
 # Generated from Charles Proxy capture
 #
@@ -361,26 +529,26 @@ set sleeptime "30000";
 set jitter "20";
 set useragent "{user_agent}";
 
-{http_config}
-
-{http_get}
-
-{http_post}
-
-{http_stager}
+''')
+        self._emit_http_config(write, requests)
+        write('\n\n')
+        self._emit_http_get(write, requests, summary)
+        write('\n\n')
+        self._emit_http_post(write, requests, summary)
+        write('\n\n')
+        self._emit_http_stager(write, requests, summary)
+        write(f'''
 
 # HTTPS beacon (mirrors HTTP)
 https-beacon {{
     # Copy http-get settings
-    set uri "{' '.join(self.generate_uri_patterns(requests))}";
+    set uri "{' '.join(uri_patterns)}";
     
     client {{
         # Add SSL-specific headers
         header "Upgrade-Insecure-Requests" "1";
     }}
-}}'''
-        
-        return profile
+}}''')
 
 def main():
     parser = argparse.ArgumentParser(description='Convert Charles Proxy captures to Cobalt Strike profiles')
@@ -418,6 +586,13 @@ def main():
     
     print(f"Parsed {len(requests)} requests", file=sys.stderr)
     
+    # Write a full profile straight to the output file
+    if args.block == 'full' and args.output:
+        with open(args.output, 'w') as f:
+            converter.write_full_profile(f.write, requests, args.name)
+        print(f"Profile written to {args.output}", file=sys.stderr)
+        return
+    
     # Generate output
     if args.block == 'full':
         output = converter.generate_full_profile(requests, args.name)